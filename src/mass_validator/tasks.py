@@ -1,7 +1,7 @@
 from celery import current_task
 
 from core.celery_app import app
-from mass_validator.validator.search_api import check_siret
+from mass_validator.validator import search_api
 
 
 @app.task
@@ -11,18 +11,10 @@ def check_sirets(data):
 
     :param data: {"siret": row.siret, "row_number": row.index}
     """
-    errors = []
-    count = len(data)
-    for idx, el in enumerate(data):
+    active_sirets = search_api.check_sirets([el["siret"] for el in data])
 
-        siret_exists = check_siret(el["siret"])
+    errors = [el for el in data if el["siret"] not in active_sirets]
 
-        current_task.update_state(
-            state="PROGRESS", meta={"progress": round(100 * ((idx + 1) / count))}
-        )
-
-        if not siret_exists:
-            errors.append(el)
     current_task.update_state(state="DONE", meta={"progress": 100})
 
     return errors
@@ -26,6 +26,9 @@ COMPANY_TYPES = [
     "ECO_ORGANISME",
 ]
 
+# membership checks run once per row, keep them O(1)
+COMPANY_TYPES_SET = frozenset(COMPANY_TYPES)
+
 MIN_ETAB_ROW = 1
 MAX_ETAB_COL = 7
 MIN_ROLE_ROW = 1
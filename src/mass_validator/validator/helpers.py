@@ -1,9 +1,15 @@
 import os
+from functools import lru_cache
 from itertools import islice
 
 
+@lru_cache(maxsize=8192)
 def quote(v):
-    """Let's double quote all the things"""
+    """Let's double quote all the things
+
+    Cached: exports quote the same handful of values (roles, company
+    types, empty cells) over and over.
+    """
     if v is None:
         v = ""
     return f'"{v}"'
@@ -61,9 +67,9 @@ def clean_from_funky_chars(value):
 
 
 def dict_read(row, fields_config):
-    """Co,vert row read form openpyxl to dict according to field_config file names"""
+    """Convert a values tuple read from openpyxl to dict according to field_config file names"""
     data = {}
-    for i, cell in enumerate(row):
+    for i, value in enumerate(row):
         field_name = fields_config[i]
-        data[field_name] = clean_from_funky_chars(process_field(cell.value, field_name))
+        data[field_name] = clean_from_funky_chars(process_field(value, field_name))
     return data
@@ -2,11 +2,11 @@ import re
 from itertools import chain
 
 import attr
-from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
 
 from .constants import (
     COMPANY_TYPES,
+    COMPANY_TYPES_SET,
     ERROR_STR,
     ETABLISSEMENTS_FIELDS,
     MAX_ETAB_COL,
@@ -18,7 +18,29 @@ from .constants import (
 )
 from .helpers import dict_read, format_csv_row, quote
 
-phone_re = re.compile(r"^(0[1-9])(?:[ _.-]?(\d{2})){4}$")
+# ASCII flag: french phone numbers only ever use ascii digits, no point
+# checking \d against the full unicode digit table
+phone_re = re.compile(r"\A0[1-9](?:[ _.-]?\d{2}){4}\Z", re.ASCII)
+
+# instantiated once, EmailValidator compiles its regexes at init time
+_EMAIL_VALIDATOR = EmailValidator()
+
+
+def email_matches(value):
+    """Run EmailValidator's own regexes, without the ValidationError round-trip.
+
+    Returns a bool, which keeps the per-row hot path free of exception
+    construction while keeping Django's validation semantics.
+    """
+    if "@" not in value:
+        return False
+    user_part, domain_part = value.rsplit("@", 1)
+    if not _EMAIL_VALIDATOR.user_regex.match(user_part):
+        return False
+    return bool(_EMAIL_VALIDATOR.validate_domain_part(domain_part))
+
+
+_ROLES = frozenset(("MEMBER", "ADMIN"))
 
 ETABLISSEMENTS_TAB = "Établissements"
 ROLES_TAB = "Rôles"
@@ -35,8 +57,17 @@ ERROR_TYPES = [
     ERROR_DUPLICATE_ROLE,
 ]
 
+# field names come from a fixed vocabulary, precompute the capitalized
+# forms used in error reports
+_CAPITALIZED_FIELDS = {
+    field: field.capitalize() for field in chain(ETABLISSEMENTS_FIELDS, ROLES_FIELDS)
+}
+
 
 class BaseRow:
+    # keep subclasses dict-free once they opt into attrs slots
+    __slots__ = ()
+
     @property
     def is_valid(self):
         if not self.validated:
@@ -44,17 +75,31 @@ class BaseRow:
         return not self.errors
 
     def siret_is_valid(self):
-        return len(str(self.siret)) == 14
+        # sirets come out of process_field as str (or None for empty cells),
+        # no need to stringify again
+        siret = self.siret
+        if not isinstance(siret, str):
+            siret = str(siret)
+        return len(siret) == 14
+
+    def add_error(self, field_name, field_value, error_type=ERROR_FIELD):
+        # store errors as plain tuples (RowError positional order), the
+        # attrs instances are only built when reporting via get_errors
+        self.errors.append(
+            (self.index, field_name, field_value, error_type, self.tab_name)
+        )
 
     @classmethod
     def from_dict(cls, idx, the_dict):
-        if all([not v for v in the_dict.values()]):  # skip empty rows
+        if not any(the_dict.values()):  # skip empty rows
             return
 
         return cls(**the_dict, index=idx)
 
 
 class BaseRows:
+    __slots__ = ()
+
     def __iter__(self):
         yield from self.rows
 
@@ -65,11 +110,14 @@ class BaseRows:
             self.rows.append(row)
 
     def get_errors(self):
-        errors = [row.errors for row in self.rows]
-        return chain.from_iterable(errors)
+        errors = chain.from_iterable(row.errors for row in self.rows)
+        return (
+            RowError(row_number, field_name, field_value, error_type, tab)
+            for row_number, field_name, field_value, error_type, tab in errors
+        )
 
 
-@attr.s()
+@attr.s(slots=True)
 class RowError:
     row_number = attr.ib()
     field_name = attr.ib()
@@ -89,7 +137,10 @@ class RowError:
         return self.field_value
 
     def as_str(self):
-        return f"{self.field_name.capitalize()} error on row n°{self.row_number} value={self.field_value}"
+        field_name = (
+            _CAPITALIZED_FIELDS.get(self.field_name) or self.field_name.capitalize()
+        )
+        return f"{field_name} error on row n°{self.row_number} value={self.field_value}"
 
     def verbose_error_field(self):
         company_types = ",".join(COMPANY_TYPES)
@@ -123,7 +174,7 @@ class RowError:
         return self.verbose_error_field()
 
 
-@attr.s()
+@attr.s(slots=True)
 class SiretError:
     siret = attr.ib()
     row_number = attr.ib()
@@ -133,7 +184,7 @@ class SiretError:
         return "Ce siret est non diffusible"
 
 
-@attr.s()
+@attr.s(slots=True)
 class EtabRow(BaseRow):
     index = attr.ib()
     siret = attr.ib(default="")
@@ -183,79 +234,37 @@ class EtabRow(BaseRow):
     def company_types_are_valid(self):
         if not self.companyTypes:
             return False
-        return all([c_type in COMPANY_TYPES for c_type in self.companyTypes])
+        return all(c_type in COMPANY_TYPES_SET for c_type in self.companyTypes)
 
     def phone_number_is_valid(self):
         if not self.contactPhone:
             return True
-        return phone_re.match(self.contactPhone) is not None
+        return phone_re.fullmatch(self.contactPhone) is not None
 
     def email_is_valid(self):
         if not self.contactEmail:
             return True
-        try:
-            EmailValidator()(
-                self.contactEmail,
-            )
-            return True
-        except ValidationError:
-            return False
+        return email_matches(self.contactEmail)
 
     def validate(self):
 
         if not self.siret_is_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="siret",
-                    field_value=self.siret,
-                    tab=self.tab_name,
-                )
-            )
+            self.add_error("siret", self.siret)
         if not self.company_types_are_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="companyTypes",
-                    field_value=self.companyTypes,
-                    tab=self.tab_name,
-                )
-            )
+            self.add_error("companyTypes", self.companyTypes)
         if not self.phone_number_is_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="contactPhone",
-                    field_value=self.contactPhone,
-                    tab=self.tab_name,
-                )
-            )
+            self.add_error("contactPhone", self.contactPhone)
         if not self.email_is_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="contactEmail",
-                    field_value=self.contactEmail,
-                    tab=self.tab_name,
-                )
-            )
+            self.add_error("contactEmail", self.contactEmail)
         self.validated = True
 
     def validate_has_admin(self, admin_sirets):
         if self.siret not in admin_sirets:
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="siret",
-                    field_value=self.siret,
-                    tab=self.tab_name,
-                    error_type=ERROR_SIRET_HAS_NO_ADMIN,
-                )
-            )
+            self.add_error("siret", self.siret, error_type=ERROR_SIRET_HAS_NO_ADMIN)
             self.validated = True
 
 
-@attr.s()
+@attr.s(slots=True)
 class EtabRows(BaseRows):
     header = attr.ib(default="")
     rows = attr.ib(default=attr.Factory(list))
@@ -272,7 +281,7 @@ class EtabRows(BaseRows):
             self.rows.append(row)
 
     def sirets(self):
-        return list(set([item.siret for item in self if item.siret]))
+        return {item.siret for item in self if item.siret}
 
     def validate(self):
         self.is_valid = True
@@ -294,28 +303,27 @@ class EtabRows(BaseRows):
                 self.is_valid = False
 
     def as_csv(self):
-        ret = []
-        ret.append(format_csv_row([quote(fn) for fn in ETABLISSEMENTS_FIELDS]))
+        yield format_csv_row([quote(fn) for fn in ETABLISSEMENTS_FIELDS])
         for row in self:
-            ret.append(row.as_csv())
-        return ret
+            yield row.as_csv()
 
     @classmethod
     def from_worksheet(cls, worksheet):
         etab_rows = []
-        idx = 1
-        for row in worksheet.iter_rows(min_row=MIN_ETAB_ROW, max_col=MAX_ETAB_COL):
+        rows = worksheet.iter_rows(
+            min_row=MIN_ETAB_ROW, max_col=MAX_ETAB_COL, values_only=True
+        )
+        next(rows, None)  # header, validated upstream
+        for idx, row in enumerate(rows, start=2):
             data = dict_read(row, ETABLISSEMENTS_FIELDS)
-            if idx != 1:
-                etab_row = EtabRow.from_dict(idx, data)
+            etab_row = EtabRow.from_dict(idx, data)
 
-                if etab_row:
-                    etab_rows.append(etab_row)
-            idx += 1
+            if etab_row:
+                etab_rows.append(etab_row)
         return cls(rows=etab_rows)
 
 
-@attr.s()
+@attr.s(slots=True)
 class RoleRow(BaseRow):
     index = attr.ib()
     siret = attr.ib()
@@ -347,7 +355,7 @@ class RoleRow(BaseRow):
         return format_csv_row(quoted)
 
     def role_is_valid(self):
-        return self.role in ["MEMBER", "ADMIN"]
+        return self.role in _ROLES
 
     def siret_belongs_to(self, etab_sirets):
         return self.siret in etab_sirets
@@ -355,68 +363,28 @@ class RoleRow(BaseRow):
     def email_is_valid(self):
         if not self.email:
             return False
-
-        try:
-            EmailValidator()(
-                self.email,
-            )
-            return True
-        except ValidationError:
-            return False
+        return email_matches(self.email)
 
     def validate(self, etab_sirets):
         if not self.role_is_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="role",
-                    field_value=self.role,
-                    tab=self.tab_name,
-                )
-            )
+            self.add_error("role", self.role)
         if not self.siret_is_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="siret",
-                    field_value=self.siret,
-                    tab=self.tab_name,
-                )
-            )
-        if not self.siret_belongs_to(etab_sirets):
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="siret",
-                    field_value=self.siret,
-                    tab=ROLES_TAB,
-                    error_type=ERROR_SIRET_MISSING_FROM_ETAB,
-                )
+            self.add_error("siret", self.siret)
+        # a missing siret already got a format error above, no point also
+        # reporting it as absent from the etablissements tab
+        if self.siret and not self.siret_belongs_to(etab_sirets):
+            self.add_error(
+                "siret", self.siret, error_type=ERROR_SIRET_MISSING_FROM_ETAB
             )
         if not self.email_is_valid():
-            self.errors.append(
-                RowError(
-                    row_number=self.index,
-                    field_name="email",
-                    field_value=self.email,
-                    tab=self.tab_name,
-                )
-            )
+            self.add_error("email", self.email)
         self.validated = True
 
     def mark_as_duplicate(self):
-        self.errors.append(
-            RowError(
-                row_number=self.index,
-                field_name="email",
-                field_value=self.email,
-                tab=self.tab_name,
-                error_type=ERROR_DUPLICATE_ROLE,
-            )
-        )
+        self.add_error("email", self.email, error_type=ERROR_DUPLICATE_ROLE)
 
 
-@attr.s()
+@attr.s(slots=True)
 class RoleRows(BaseRows):
     header = attr.ib(default="")
     rows = attr.ib(default=attr.Factory(list))
@@ -424,19 +392,19 @@ class RoleRows(BaseRows):
     verbose_errors = attr.ib(default=attr.Factory(list))
 
     def admin_sirets(self):
-        return list(
-            set([row.siret for row in self if row.siret and row.role == "ADMIN"])
-        )
+        return {row.siret for row in self if row.siret and row.role == "ADMIN"}
 
     def as_csv(self):
-        ret = []
-        ret.append(format_csv_row([quote(fn) for fn in ROLES_FIELDS]))
+        yield format_csv_row([quote(fn) for fn in ROLES_FIELDS])
         for row in self:
-            ret.append(row.as_csv())
-        return ret
+            yield row.as_csv()
 
     def validate(self, etab_sirets):
 
+        # guard against callers passing a list: membership is tested per row
+        if not isinstance(etab_sirets, (set, frozenset)):
+            etab_sirets = frozenset(etab_sirets)
+
         self.is_valid = True
         for row in self:
             row.validate(etab_sirets)
@@ -462,13 +430,14 @@ class RoleRows(BaseRows):
     @classmethod
     def from_worksheet(cls, worksheet):
         role_rows = []
-        idx = 1
-        for row in worksheet.iter_rows(min_row=MIN_ROLE_ROW, max_col=MAX_ROLE_COL):
+        rows = worksheet.iter_rows(
+            min_row=MIN_ROLE_ROW, max_col=MAX_ROLE_COL, values_only=True
+        )
+        next(rows, None)  # header, validated upstream
+        for idx, row in enumerate(rows, start=2):
             data = dict_read(row, ROLES_FIELDS)
-            if idx != 1:
-                role_row = RoleRow.from_dict(idx, data)
+            role_row = RoleRow.from_dict(idx, data)
 
-                if role_row:
-                    role_rows.append(role_row)
-            idx += 1
+            if role_row:
+                role_rows.append(role_row)
         return cls(rows=role_rows)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.conf import settings
 from elasticsearch7 import Elasticsearch
 
@@ -6,9 +8,21 @@ ACTIVE = "A"
 CERT_PATH = str(settings.BASE_DIR / "certs.pem")
 
 
+@lru_cache()
+def get_client():
+    """Lazy singleton, reuses the underlying connection pool across calls."""
+    return Elasticsearch(
+        settings.TD_COMPANY_ELASTICSEARCH_URL,
+        ca_certs=CERT_PATH,
+        http_compress=True,
+        timeout=30,
+    )
+
+
+@lru_cache(maxsize=100_000)
 def check_siret(siret):
 
-    es = Elasticsearch(settings.TD_COMPANY_ELASTICSEARCH_URL, ca_certs=CERT_PATH)
+    es = get_client()
 
     body = {"query": {"bool": {"must": [{"match": {"siret": siret}}]}}}
     resp = es.search(index=settings.TD_COMPANY_ELASTICSEARCH_INDEX, body=body)
@@ -20,3 +34,31 @@ def check_siret(siret):
         if hit.get("_source", {}).get("etatAdministratifEtablissement", None) == ACTIVE:
             return True
     return False
+
+
+def check_sirets(sirets):
+    """Check all `sirets` in a single query, return the set of active ones.
+
+    One round-trip instead of one per siret; callers test membership on
+    the returned set.
+    """
+    if not sirets:
+        return set()
+
+    es = get_client()
+
+    body = {
+        "query": {
+            "bool": {
+                "must": [
+                    {"terms": {"siret": list(sirets)}},
+                    {"match": {"etatAdministratifEtablissement": ACTIVE}},
+                ]
+            }
+        },
+        "_source": ["siret"],
+        "size": len(sirets),
+    }
+    resp = es.search(index=settings.TD_COMPANY_ELASTICSEARCH_INDEX, body=body)
+    hits = resp.get("hits", {}).get("hits", [])
+    return {hit["_source"]["siret"] for hit in hits if hit.get("_source")}